@@ -0,0 +1,5 @@
+"""CPU benchmark suite for the hot paths of ``gradio_demo.py``.
+
+Run ``python -m benchmarks run`` to time the suite and
+``python -m benchmarks compare BASELINE CURRENT`` to flag slowdowns.
+"""
@@ -0,0 +1,68 @@
+"""Command line entry point: ``python -m benchmarks {run,compare}``."""
+import sys
+import argparse
+
+from benchmarks.suite import BENCHMARKS, compare, load_report, run, save_report
+
+
+def _format(value, spec):
+    return "-" if value is None else format(value, spec)
+
+
+def print_comparison(rows, threshold):
+    print(f"{'benchmark':<26} {'metric':<14} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, metric, base, cur, change, status in rows:
+        flag = "" if status == "ok" else f"  {status}"
+        print(f"{name:<26} {metric:<14} {_format(base, '>12.6g'):>12} {_format(cur, '>12.6g'):>12} "
+              f"{_format(change, '>+8.1%'):>9}{flag}")
+    print(f"threshold: {threshold:.0%}")
+
+
+def check(baseline, current, args):
+    rows, failures, errors = compare(baseline, current, args.threshold, args.metric or ["p50"],
+                                     getattr(args, "only", None))
+    print_comparison(rows, args.threshold)
+    for error in errors:
+        print(f"error: {error}", file=sys.stderr)
+    if failures:
+        print(f"{len(failures)} regression(s) beyond {args.threshold:.0%} or missing result(s)", file=sys.stderr)
+    return 1 if failures or errors else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time the suite and write a JSON report")
+    run_parser.add_argument("-o", "--output", help="where to save the report (JSON)")
+    run_parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="benchmarks to run")
+    run_parser.add_argument("--scale", type=float, default=1.0,
+                            help="multiply the number of samples (e.g. 0.1 for a smoke run)")
+    run_parser.add_argument("--model", help="Hugging Face model to run on CPU instead of the mock backend")
+    run_parser.add_argument("--baseline", help="compare against this report after the run")
+
+    compare_parser = commands.add_parser("compare", help="flag slowdowns between two reports")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--threshold", type=float, default=0.10,
+                         help="relative slowdown that counts as a regression (default: 0.10)")
+        sub.add_argument("--metric", action="append",
+                         help="metric to compare, repeatable (default: p50; *_per_s are higher-is-better)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return check(load_report(args.baseline), load_report(args.current), args)
+
+    report = run(args.only, args.scale, args.model)
+    if args.output:
+        save_report(report, args.output)
+    if args.baseline:
+        return check(load_report(args.baseline), report, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""Mock model backend and local Wordle env used to import the demo on CPU.
+
+``load_demo()`` registers stand-in ``unsloth`` and ``envs.wordle_env`` modules
+before importing ``gradio_demo``, so the demo's own functions can be timed
+without a GPU, a model download or an OpenEnv server.
+"""
+import re
+import sys
+import types
+import random
+import importlib
+from enum import Enum
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+# --- Canned model reply (what a fine-tuned model typically answers) ---
+RESPONSE = '''```python
+def strategy(letters_board, status_board):
+    import string
+    greens = [""] * 5
+    present = set()
+    absent = set()
+    banned = [set() for _ in range(5)]
+    for row in range(len(letters_board)):
+        for col in range(5):
+            letter = letters_board[row][col]
+            state = status_board[row][col]
+            if state == 3:
+                greens[col] = letter
+            elif state == 2:
+                present.add(letter)
+                banned[col].add(letter)
+            elif state == 1:
+                absent.add(letter)
+    absent -= present | set(greens)
+    pool = [c for c in string.ascii_uppercase if c not in absent]
+    todo = [c for c in sorted(present) if c not in greens]
+    guess = []
+    for col in range(5):
+        if greens[col]:
+            guess.append(greens[col])
+            continue
+        choice = next((c for c in todo if c not in banned[col]), None)
+        if choice:
+            todo.remove(choice)
+        else:
+            choice = next((c for c in pool if c not in banned[col] and c not in guess), pool[0])
+        guess.append(choice)
+    return "".join(guess)
+```'''
+
+SPECIAL_TOKENS = ("<|start|>", "<|message|>", "<|end|>")
+TOKEN_PATTERN = re.compile(r"<\|\w+\|>|\w+|\s+|[^\w\s]")
+
+
+# --- Mock tokenizer / model ---
+class MockInputs(dict):
+    """Minimal stand-in for ``BatchEncoding``."""
+
+    def to(self, device):
+        return self
+
+
+class MockTokenizer:
+    """Regex tokenizer with a growing vocabulary; round-trips text exactly."""
+
+    def __init__(self):
+        self.vocab = {}
+        self.id_to_token = []
+        self.special_ids = {self._id(token) for token in SPECIAL_TOKENS}
+
+    def _id(self, token):
+        if token not in self.vocab:
+            self.vocab[token] = len(self.id_to_token)
+            self.id_to_token.append(token)
+        return self.vocab[token]
+
+    def encode(self, text):
+        return [self._id(token) for token in TOKEN_PATTERN.findall(text)]
+
+    def apply_chat_template(self, messages, add_generation_prompt=False, return_tensors=None,
+                            return_dict=False, **kwargs):
+        text = "".join(f"<|start|>{m['role']}<|message|>{m['content']}<|end|>" for m in messages)
+        if add_generation_prompt:
+            text += "<|start|>assistant<|message|>"
+        input_ids = [self.encode(text)]
+        return MockInputs(input_ids=input_ids, attention_mask=[[1] * len(input_ids[0])])
+
+    def decode(self, ids, skip_special_tokens=False):
+        return "".join(
+            self.id_to_token[i] for i in ids
+            if not (skip_special_tokens and i in self.special_ids)
+        )
+
+
+class MockModel:
+    """Echoes the prompt followed by ``RESPONSE``, like ``generate`` on a causal LM."""
+
+    device = "cpu"
+
+    def __init__(self, tokenizer, response=RESPONSE):
+        self.response_ids = tokenizer.encode(response) + [tokenizer.vocab["<|end|>"]]
+
+    def generate(self, input_ids, attention_mask=None, max_new_tokens=1024, **kwargs):
+        return [list(input_ids[0]) + self.response_ids[:max_new_tokens]]
+
+
+class CountingModel:
+    """Wraps a model and records how many tokens the last ``generate`` produced."""
+
+    def __init__(self, model):
+        self.model = model
+        self.new_tokens = 0
+
+    def __getattr__(self, name):
+        return getattr(self.model, name)
+
+    def generate(self, **inputs):
+        outputs = self.model.generate(**inputs)
+        self.new_tokens = len(outputs[0]) - len(inputs["input_ids"][0])
+        return outputs
+
+
+def load_backend(model_name=None):
+    """Returns (model, tokenizer): the mock backend, or a real HF model on CPU."""
+    if model_name is None:
+        tokenizer = MockTokenizer()
+        return CountingModel(MockModel(tokenizer)), tokenizer
+
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForCausalLM.from_pretrained(model_name).to("cpu").eval()
+    return CountingModel(model), tokenizer
+
+
+# --- Local Wordle env ---
+WORDS = [
+    "CRANE", "SLATE", "TRACE", "BRICK", "PLANT", "GHOST", "MOUSE", "CHAIR",
+    "FLAME", "STORM", "GRAPE", "WORLD", "LIGHT", "HOUSE", "TRAIN", "BREAD",
+    "SHINE", "CLOUD", "RIVER", "STONE", "QUEEN", "PIXEL", "JUMBO", "VIVID",
+    "EMBER", "NOBLE", "DWARF", "KNACK", "SPOON", "LEVEL", "APPLE", "ZEBRA",
+]
+
+
+class LetterStatus(str, Enum):
+    CORRECT = "correct"
+    WRONG_POSITION = "wrong_position"
+    NOT_IN_WORD = "not_in_word"
+
+
+@dataclass
+class LetterFeedback:
+    letter: str
+    status: LetterStatus
+
+
+@dataclass
+class WordleAction:
+    guess: str
+
+
+@dataclass
+class WordleObservation:
+    feedback: List[LetterFeedback] = field(default_factory=list)
+    attempt_number: int = 0
+    max_attempts: int = 6
+    game_won: bool = False
+    game_lost: bool = False
+    reward: float = 0.0
+    done: bool = False
+    correct_word: Optional[str] = None
+
+
+@dataclass
+class StepResult:
+    observation: WordleObservation
+    reward: float = 0.0
+    done: bool = False
+
+
+def score_guess(guess, target):
+    """Wordle feedback for ``guess``, counting repeated letters correctly."""
+    statuses = [LetterStatus.NOT_IN_WORD] * 5
+    remaining = {}
+    for i, (g, t) in enumerate(zip(guess, target)):
+        if g == t:
+            statuses[i] = LetterStatus.CORRECT
+        else:
+            remaining[t] = remaining.get(t, 0) + 1
+    for i, g in enumerate(guess):
+        if statuses[i] != LetterStatus.CORRECT and remaining.get(g, 0):
+            statuses[i] = LetterStatus.WRONG_POSITION
+            remaining[g] -= 1
+    return [LetterFeedback(letter, status) for letter, status in zip(guess, statuses)]
+
+
+class WordleEnv:
+    """In-process replacement for the OpenEnv Wordle client (seeded targets)."""
+
+    def __init__(self, seed=0, max_attempts=6, words=WORDS):
+        self.rng = random.Random(seed)
+        self.max_attempts = max_attempts
+        self.words = words
+        self.target = None
+        self.attempts = 0
+
+    def reset(self):
+        self.target = self.rng.choice(self.words)
+        self.attempts = 0
+        return StepResult(WordleObservation(max_attempts=self.max_attempts))
+
+    def step(self, action):
+        guess = action.guess.upper()
+        self.attempts += 1
+        won = guess == self.target
+        lost = not won and self.attempts >= self.max_attempts
+        reward = 1.0 if won else 0.0
+        observation = WordleObservation(
+            feedback=score_guess(guess, self.target),
+            attempt_number=self.attempts,
+            max_attempts=self.max_attempts,
+            game_won=won,
+            game_lost=lost,
+            reward=reward,
+            done=won or lost,
+            correct_word=self.target if won or lost else None,
+        )
+        return StepResult(observation, reward, won or lost)
+
+
+def launch_openenv(port, openenv_process, openenv_class=WordleEnv, **kwargs):
+    """Same contract as ``unsloth.launch_openenv``, but keeps the env in-process."""
+    if openenv_process is None:
+        openenv_process = openenv_class()
+    return port, openenv_process
+
+
+# --- Module registration ---
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+    return module
+
+
+def load_demo(model_name=None):
+    """Imports ``gradio_demo`` against the stand-ins, with UI pacing delays disabled."""
+    model, tokenizer = load_backend(model_name)
+
+    class FastLanguageModel:
+        @staticmethod
+        def from_pretrained(*args, **kwargs):
+            return model, tokenizer
+
+    _module(
+        "unsloth",
+        FastLanguageModel=FastLanguageModel,
+        launch_openenv=launch_openenv,
+        is_port_open=lambda *args, **kwargs: True,
+    )
+    envs = _module("envs", __path__=[])
+    envs.wordle_env = _module("envs.wordle_env", __path__=[], WordleEnv=WordleEnv)
+    envs.wordle_env.models = _module(
+        "envs.wordle_env.models",
+        WordleAction=WordleAction,
+        WordleObservation=WordleObservation,
+        LetterStatus=LetterStatus,
+        LetterFeedback=LetterFeedback,
+    )
+
+    sys.modules.pop("gradio_demo", None)
+    demo = importlib.import_module("gradio_demo")
+    demo.STREAM_DELAY = demo.GUESS_DELAY = demo.STEP_DELAY = demo.START_DELAY = 0
+    return demo
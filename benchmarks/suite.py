@@ -0,0 +1,272 @@
+"""Benchmark cases, timing helpers and baseline comparison."""
+import io
+import sys
+import json
+import math
+import time
+import platform
+import contextlib
+from datetime import datetime, timezone
+from importlib import metadata
+
+from benchmarks.standins import WordleAction, load_demo
+
+
+# --- Timing ---
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = math.ceil(q / 100 * len(sorted_values))
+    return sorted_values[min(len(sorted_values), max(rank, 1)) - 1]
+
+
+def measure(fn, number=1, repeat=30, warmup=3):
+    """Calls ``fn`` ``number`` times per sample and returns per-call seconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+P99_MIN_SAMPLES = 100
+
+
+def summarize(samples, per_sample_calls=1, **extra):
+    """Per-call statistics of ``measure`` samples.
+
+    When each sample averages a batch of calls, its percentiles describe batch
+    means rather than single calls, so p99 is only reported for unbatched runs.
+    It also needs at least ``P99_MIN_SAMPLES`` samples, or it is just the max.
+    """
+    ordered = sorted(samples)
+    mean = sum(ordered) / len(ordered)
+    result = {
+        "unit": "s",
+        "samples": len(ordered),
+        "per_sample_calls": per_sample_calls,
+        "mean": mean,
+        "min": ordered[0],
+        "p50": percentile(ordered, 50),
+    }
+    if per_sample_calls == 1 and len(ordered) >= P99_MIN_SAMPLES:
+        result["p99"] = percentile(ordered, 99)
+    result["ops_per_s"] = 1 / mean if mean else float("inf")
+    result.update(extra)
+    return result
+
+
+# --- Benchmark cases ---
+def _reset_env(demo):
+    demo.port, demo.openenv_process = demo.launch_openenv(demo.port, demo.openenv_process)
+    return demo.openenv_process.reset().observation
+
+
+def _play_one_game(demo, strategy):
+    for _ in demo.execute_wordle_strategy(strategy, _reset_env(demo)):
+        pass
+    if not demo.openenv_process.attempts:
+        raise RuntimeError("execute_wordle_strategy stopped before the first guess")
+
+
+def bench_extract_function(demo, scale):
+    text = demo.TOKENIZER.decode(
+        demo.MODEL.generate(**_chat_inputs(demo), max_new_tokens=1024)[0], skip_special_tokens=True
+    )
+    if demo.extract_function(text) is None:
+        raise RuntimeError("extract_function found no strategy in the model output")
+    samples = measure(lambda: demo.extract_function(text), number=200, repeat=_n(30, scale))
+    return summarize(samples, per_sample_calls=200)
+
+
+def bench_convert_to_board(demo, scale):
+    _reset_env(demo)
+    observation = demo.openenv_process.step(WordleAction(guess="CRANE")).observation
+    samples = measure(lambda: demo.convert_to_board(observation), number=200, repeat=_n(30, scale))
+    return summarize(samples, per_sample_calls=200)
+
+
+def bench_render_wordle_html(demo, scale):
+    _reset_env(demo)
+    observation = demo.openenv_process.step(WordleAction(guess="CRANE")).observation
+    letters_board, status_board = demo.convert_to_board(observation)
+    # Worst case: every row filled and the last one flipping
+    rows = letters_board.shape[0]
+    filled = min(observation.attempt_number, rows - 1)
+    letters_board[:] = letters_board[filled]
+    status_board[:] = status_board[filled]
+    samples = measure(
+        lambda: demo.render_wordle_html(letters_board, status_board, current_row=rows - 1, animate=True),
+        number=50,
+        repeat=_n(30, scale),
+    )
+    return summarize(samples, per_sample_calls=50)
+
+
+def bench_execute_wordle_strategy(demo, scale):
+    strategy = _strategy(demo)
+    guesses = []
+
+    def game():
+        _play_one_game(demo, strategy)
+        guesses.append(demo.openenv_process.attempts)
+
+    # Warm up by hand so guesses_per_s only counts the timed games
+    for _ in range(3):
+        game()
+    guesses.clear()
+    result = summarize(measure(game, repeat=_n(200, scale), warmup=0))
+    result["guesses_per_s"] = sum(guesses) / (result["mean"] * len(guesses))
+    return result
+
+
+def bench_generate(demo, scale):
+    samples = measure(demo.generate, repeat=_n(20, scale), warmup=1)
+    new_tokens = demo.MODEL.new_tokens
+    result = summarize(samples, new_tokens=new_tokens)
+    result["tokens_per_s"] = new_tokens / result["mean"]
+    return result
+
+
+def bench_play_wordle_with_llm(demo, scale):
+    def click():
+        for code, board_html, stats in demo.play_wordle_with_llm():
+            pass
+        if not board_html:
+            raise RuntimeError(f"play_wordle_with_llm failed: {stats}")
+        if not demo.openenv_process.attempts:
+            raise RuntimeError("play_wordle_with_llm stopped before the first guess")
+
+    result = summarize(measure(click, repeat=_n(200, scale), warmup=1))
+    result["clicks_per_s"] = result.pop("ops_per_s")
+    return result
+
+
+def _chat_inputs(demo):
+    return demo.TOKENIZER.apply_chat_template(
+        [{"role": "user", "content": demo.PROMPT}],
+        add_generation_prompt=True,
+        return_tensors="pt",
+        return_dict=True,
+        reasoning_effort="low",
+    ).to(demo.MODEL.device)
+
+
+def _strategy(demo):
+    local_env = {}
+    exec(demo.generate(), {}, local_env)
+    return local_env["strategy"]
+
+
+def _n(count, scale):
+    return max(1, int(count * scale))
+
+
+BENCHMARKS = {
+    "extract_function": bench_extract_function,
+    "convert_to_board": bench_convert_to_board,
+    "render_wordle_html": bench_render_wordle_html,
+    "execute_wordle_strategy": bench_execute_wordle_strategy,
+    "generate": bench_generate,
+    "play_wordle_with_llm": bench_play_wordle_with_llm,
+}
+
+
+def run(names=None, scale=1.0, model_name=None):
+    """Runs the selected benchmarks and returns a JSON-serialisable report."""
+    demo = load_demo(model_name)
+    results = {}
+    for name in names or BENCHMARKS:
+        # generate() prints the whole model output; keep it out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = BENCHMARKS[name](demo, scale)
+        result = results[name]
+        if "p99" in result:
+            detail = f"p99 {result['p99'] * 1e6:>12.1f} us"
+        elif result["per_sample_calls"] > 1:
+            detail = f"(means of {result['per_sample_calls']} calls)"
+        else:
+            detail = f"(no p99: {result['samples']} samples)"
+        print(f"{name:<26} p50 {result['p50'] * 1e6:>12.1f} us   {detail}", file=sys.stderr)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": metadata.version("numpy"),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "backend": model_name or "mock",
+            "scale": scale,
+        },
+        "benchmarks": results,
+    }
+
+
+# --- Baseline comparison ---
+def relative_change(base, cur):
+    """``cur / base - 1``; a zero baseline only compares equal to zero."""
+    if base:
+        return cur / base - 1
+    return 0.0 if cur == base else math.copysign(math.inf, cur)
+
+
+# Reports are only comparable when these were the same for both runs
+COMPARABLE_META = ("backend", "scale")
+
+
+def compare(baseline, current, threshold=0.10, metrics=("p50",), names=None):
+    """Returns (rows, failures, errors) comparing two reports.
+
+    Latency metrics regress when they grow by more than ``threshold``;
+    ``*_per_s`` throughput metrics regress when they drop by more than it.
+    Each row is ``(name, metric, base, cur, change, status)`` with status
+    "ok", "REGRESSION" or "missing"; failures are the rows that are not "ok".
+    ``names`` limits the comparison to the benchmarks the current run covered.
+    Errors name metrics found in no benchmark, ``COMPARABLE_META`` keys that
+    differ between the reports, or say that nothing was compared.
+    """
+    rows, errors = [], []
+    for key in COMPARABLE_META:
+        base_meta, cur_meta = baseline.get("meta", {}), current.get("meta", {})
+        if key in base_meta and key in cur_meta and base_meta[key] != cur_meta[key]:
+            errors.append(f"{key} differs: baseline {base_meta[key]!r}, current {cur_meta[key]!r}")
+
+    for name, base in baseline["benchmarks"].items():
+        if names is not None and name not in names:
+            continue
+        cur = current["benchmarks"].get(name)
+        if cur is None:
+            rows.append((name, "-", None, None, None, "missing"))
+            continue
+        for metric in metrics:
+            if metric not in base:
+                continue
+            if metric not in cur:
+                rows.append((name, metric, base[metric], None, None, "missing"))
+                continue
+            change = relative_change(base[metric], cur[metric])
+            higher_is_better = metric.endswith("_per_s")
+            regressed = -change > threshold if higher_is_better else change > threshold
+            rows.append((name, metric, base[metric], cur[metric], change, "REGRESSION" if regressed else "ok"))
+
+    for metric in metrics:
+        if not any(metric in result for report in (baseline, current) for result in report["benchmarks"].values()):
+            errors.append(f"metric {metric!r} is not reported by any benchmark")
+    if not any(row[5] != "missing" for row in rows):
+        errors.append("no metrics were compared")
+    failures = [row for row in rows if row[5] != "ok"]
+    return rows, failures, errors
+
+
+def load_report(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_report(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,192 @@
+import math
+
+from benchmarks.standins import LetterStatus, score_guess
+from benchmarks.suite import P99_MIN_SAMPLES, compare, percentile, summarize
+
+
+def report(meta=None, **benchmarks):
+    return {"meta": meta or {}, "benchmarks": benchmarks}
+
+
+def statuses(guess, target):
+    return [fb.status for fb in score_guess(guess, target)]
+
+
+# --- percentile / summarize ---
+def test_percentile_single_sample():
+    assert percentile([3.0], 50) == 3.0
+    assert percentile([3.0], 99) == 3.0
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 99) == 4
+
+
+def test_summarize_reports_p99_only_for_unbatched_samples():
+    single = summarize([i / 100 for i in range(100, 0, -1)])
+    assert single["p50"] == 0.5
+    assert single["p99"] == 0.99
+    assert single["per_sample_calls"] == 1
+    assert math.isclose(single["ops_per_s"], 1 / 0.505)
+
+    batched = summarize([0.2, 0.1] * 50, per_sample_calls=200)
+    assert batched["per_sample_calls"] == 200
+    assert "p99" not in batched
+
+
+def test_summarize_omits_p99_below_min_samples():
+    result = summarize([0.2] * (P99_MIN_SAMPLES - 1))
+    assert result["p50"] == 0.2
+    assert "p99" not in result
+
+
+# --- compare ---
+def test_compare_latency_regresses_when_slower():
+    rows, failures, errors = compare(report(a={"p50": 1.0}), report(a={"p50": 1.5}))
+    assert [row[5] for row in rows] == ["REGRESSION"]
+    assert failures == rows
+    assert errors == []
+
+    rows, failures, errors = compare(report(a={"p50": 1.0}), report(a={"p50": 0.5}))
+    assert rows[0][5] == "ok"
+    assert failures == errors == []
+
+
+def test_compare_throughput_regresses_when_lower():
+    metrics = ("tokens_per_s",)
+    rows, failures, _ = compare(report(a={"tokens_per_s": 100.0}), report(a={"tokens_per_s": 50.0}), metrics=metrics)
+    assert rows[0][5] == "REGRESSION"
+
+    rows, failures, _ = compare(report(a={"tokens_per_s": 100.0}), report(a={"tokens_per_s": 200.0}), metrics=metrics)
+    assert rows[0][5] == "ok"
+    assert failures == []
+
+
+def test_compare_threshold_boundary_is_not_a_regression():
+    base = report(a={"p50": 4.0, "ops_per_s": 4.0})
+    at_threshold = report(a={"p50": 5.0, "ops_per_s": 3.0})
+    rows, failures, _ = compare(base, at_threshold, threshold=0.25, metrics=("p50", "ops_per_s"))
+    assert [row[4] for row in rows] == [0.25, -0.25]
+    assert failures == []
+
+    rows, failures, _ = compare(base, report(a={"p50": 5.5, "ops_per_s": 2.5}), threshold=0.25,
+                                metrics=("p50", "ops_per_s"))
+    assert len(failures) == 2
+
+
+def test_compare_zero_baseline():
+    rows, failures, _ = compare(report(a={"p50": 0.0}), report(a={"p50": 0.0}))
+    assert rows[0][4] == 0.0
+    assert failures == []
+
+    rows, failures, _ = compare(report(a={"p50": 0.0}), report(a={"p50": 1.0}))
+    assert rows[0][4] == math.inf
+    assert rows[0][5] == "REGRESSION"
+
+
+def test_compare_missing_benchmark_fails():
+    rows, failures, errors = compare(report(a={"p50": 1.0}, b={"p50": 1.0}), report(a={"p50": 1.0}))
+    assert ("b", "-", None, None, None, "missing") in rows
+    assert [row[0] for row in failures] == ["b"]
+    assert errors == []
+
+
+
+def test_compare_only_checks_benchmarks_that_were_run():
+    baseline = report(a={"p50": 1.0}, b={"p50": 1.0}, c={"p50": 1.0})
+    rows, failures, errors = compare(baseline, report(a={"p50": 1.05}), names=["a"])
+    assert [(row[0], row[5]) for row in rows] == [("a", "ok")]
+    assert failures == errors == []
+
+    rows, failures, _ = compare(baseline, report(a={"p50": 1.0}), names=["a", "b"])
+    assert [(row[0], row[5]) for row in failures] == [("b", "missing")]
+
+
+def test_compare_mismatched_meta_is_an_error():
+    benchmarks = {"a": {"p50": 1.0}}
+    _, failures, errors = compare(
+        report(meta={"backend": "mock", "scale": 1.0}, **benchmarks),
+        report(meta={"backend": "gpt2", "scale": 0.1}, **benchmarks),
+    )
+    assert failures == []
+    assert len(errors) == 2
+    assert any("backend" in error for error in errors)
+    assert any("scale" in error for error in errors)
+
+    _, _, errors = compare(
+        report(meta={"backend": "mock", "scale": 1.0, "machine": "x86_64"}, **benchmarks),
+        report(meta={"backend": "mock", "scale": 1.0, "machine": "arm64"}, **benchmarks),
+    )
+    assert errors == []
+
+
+def test_compare_missing_metric_fails():
+    rows, failures, _ = compare(report(a={"p50": 1.0, "p99": 2.0}), report(a={"p50": 1.0}), metrics=("p50", "p99"))
+    assert [(row[1], row[5]) for row in rows] == [("p50", "ok"), ("p99", "missing")]
+    assert len(failures) == 1
+
+
+def test_compare_metric_absent_on_both_sides_is_skipped():
+    rows, failures, errors = compare(
+        report(a={"p50": 1.0, "p99": 1.0}, b={"p50": 1.0}),
+        report(a={"p50": 1.0, "p99": 1.0}, b={"p50": 1.0}),
+        metrics=("p99",),
+    )
+    assert [row[0] for row in rows] == ["a"]
+    assert failures == errors == []
+
+
+def test_compare_unknown_metric_is_an_error():
+    rows, failures, errors = compare(report(a={"p50": 1.0}), report(a={"p50": 1.0}), metrics=("p5O",))
+    assert rows == failures == []
+    assert any("p5O" in error for error in errors)
+    assert "no metrics were compared" in errors
+
+
+def test_compare_empty_reports_is_an_error():
+    rows, failures, errors = compare(report(), report())
+    assert rows == []
+    assert "no metrics were compared" in errors
+
+
+# --- score_guess ---
+def test_score_guess_exact_match():
+    assert statuses("CRANE", "CRANE") == [LetterStatus.CORRECT] * 5
+
+
+def test_score_guess_duplicate_letters():
+    # The E at index 3 is green; EMBER's other E makes the first E misplaced
+    assert statuses("LEVEL", "EMBER") == [
+        LetterStatus.NOT_IN_WORD,
+        LetterStatus.WRONG_POSITION,
+        LetterStatus.NOT_IN_WORD,
+        LetterStatus.CORRECT,
+        LetterStatus.NOT_IN_WORD,
+    ]
+
+
+def test_score_guess_extra_duplicates_are_not_in_word():
+    # EMBER has two Es: one green, one misplaced, the third E of EERIE is absent
+    assert statuses("EERIE", "EMBER") == [
+        LetterStatus.CORRECT,
+        LetterStatus.WRONG_POSITION,
+        LetterStatus.WRONG_POSITION,
+        LetterStatus.NOT_IN_WORD,
+        LetterStatus.NOT_IN_WORD,
+    ]
+
+
+def test_score_guess_correct_letter_takes_priority():
+    # CRANE's only E is matched by the green E, so the earlier E gets nothing
+    assert statuses("EAGLE", "CRANE") == [
+        LetterStatus.NOT_IN_WORD,
+        LetterStatus.WRONG_POSITION,
+        LetterStatus.NOT_IN_WORD,
+        LetterStatus.NOT_IN_WORD,
+        LetterStatus.CORRECT,
+    ]